@@ -22,6 +22,16 @@ from mcp_core import (
 # Initialize MCP server
 app = Server("mcp-example-server")
 
+# Tool definitions are static; build them once instead of per list_tools call
+_TOOLS = [create_hello_tool()] + create_echo_tools()
+
+# Tool name -> mcp-core handler
+_HANDLERS = {
+    "hello": hello_handler,
+    "echo": echo_handler,
+    "echo_structured": echo_structured_handler,
+}
+
 
 @app.list_resources()
 async def list_resources():
@@ -34,9 +44,9 @@ async def list_tools():
     """
     List available tools.
 
-    Uses tool definitions from mcp-core library.
+    Uses tool definitions from mcp-core library, built once at import.
     """
-    return [create_hello_tool()] + create_echo_tools()
+    return _TOOLS
 
 
 @app.call_tool()
@@ -57,14 +67,11 @@ async def call_tool(name: str, arguments: dict):
         ValueError: If tool name is unknown
     """
     # Route to mcp-core handlers
-    if name == "hello":
-        return await hello_handler(arguments)
-    elif name == "echo":
-        return await echo_handler(arguments)
-    elif name == "echo_structured":
-        return await echo_structured_handler(arguments)
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
 
-    raise ValueError(f"Unknown tool: {name}")
+    return await handler(arguments)
 
 
 async def main():
@@ -78,4 +85,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer uvloop's event loop when installed (unavailable on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -0,0 +1,45 @@
+"""
+Pytest fixtures for the methodology server tests.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+_FD_DIR = Path("/proc/self/fd")
+_APP_DIR = Path(__file__).parent.resolve()
+
+
+def _app_file_fds() -> dict[str, str]:
+    """Open descriptors pointing at files inside this app (e.g. var/*.json)."""
+    fds = {}
+    for fd in os.listdir(_FD_DIR):
+        try:
+            target = os.readlink(_FD_DIR / fd)
+        except OSError:  # closed between listdir and readlink
+            continue
+        if Path(target).is_relative_to(_APP_DIR):
+            fds[fd] = target
+    return fds
+
+
+@pytest.fixture
+def fd_guard():
+    """
+    Fail the requesting test if it leaves app files open (Linux only).
+
+    Only descriptors pointing into this app's directory are compared, so ones
+    opened by the event loop, output capture or logging do not count.
+    """
+    if not _FD_DIR.is_dir():
+        pytest.skip("fd_guard needs /proc/self/fd")
+
+    before = _app_file_fds()
+    yield
+    leaked = {
+        fd: target
+        for fd, target in _app_file_fds().items()
+        if before.get(fd) != target
+    }
+    assert not leaked, f"File descriptor leak: {leaked}"
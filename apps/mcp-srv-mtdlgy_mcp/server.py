@@ -9,30 +9,40 @@ Transport: stdio (default) + HTTP (via --transport http)
 Framework: FastMCP
 """
 import json
+import mmap
 import sys
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, NamedTuple
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, ConfigDict, Field
 
+try:
+    from orjson import loads as _json_loads
+
+    _HAVE_ORJSON = True
+except ImportError:  # optional speedup; stdlib json also accepts UTF-8 bytes
+    _json_loads = json.loads
+    _HAVE_ORJSON = False
+
 # Module-level constants
 VAR_DIR = Path(__file__).parent / "var"
 COMPILED_RULES_PATH = VAR_DIR / "compiled.rules.json"
 CATALOG_CURRENT_PATH = VAR_DIR / "catalog.current.json"
 CATALOG_PREVIOUS_PATH = VAR_DIR / "catalog.previous.json"
 
+# Files above this size are parsed from an mmap instead of a bytes copy
+MMAP_THRESHOLD = 64 * 1024
+
 # Type aliases
 ResponseFormat = Literal["json", "markdown"]
 
 # Initialize MCP server
 mcp = FastMCP("cprima_mcp-srv-mtdlgy_mcp")
 
-# Global state: loaded at startup
-compiled_rules: dict[str, Any] = {}
-catalog_current: dict[str, Any] = {}
-catalog_previous: dict[str, Any] = {}
-
 
 # =============================================================================
 # Pydantic Models (Strict Validation)
@@ -67,6 +77,14 @@ class NodeState(BaseModel):
     decision_input: dict[str, Any] | None = None
     evidence: list[Evidence] = Field(default_factory=list)
 
+    @cached_property
+    def evidence_by_type(self) -> dict[str, list[Evidence]]:
+        """Evidence bucketed by type (built on first access; state is read-only)."""
+        buckets: dict[str, list[Evidence]] = {}
+        for ev in self.evidence:
+            buckets.setdefault(ev.type, []).append(ev)
+        return buckets
+
 
 class ClientState(BaseModel):
     """Client state overlay for gate evaluation."""
@@ -81,29 +99,125 @@ class ClientState(BaseModel):
 # =============================================================================
 
 
-def load_data() -> None:
-    """Load compiled rules and catalogs at server startup."""
-    global compiled_rules, catalog_current, catalog_previous
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON file, mapping large files rather than copying them."""
+    if _HAVE_ORJSON and path.stat().st_size > MMAP_THRESHOLD:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return _json_loads(view)
+    return _json_loads(path.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def get_compiled_rules() -> dict[str, Any]:
+    """Compiled rules (indices, gates, advisory registry), parsed on first use."""
+    return _load_json_file(COMPILED_RULES_PATH)
+
+
+class Gate(NamedTuple):
+    """Compiled gate check, preprocessed once from compiled.rules.json."""
+
+    check_id: str
+    gate_id: str
+    kind: str
+    targets: tuple[str, ...]
+    field: str
+    # Per-target predicate compiled from the condition/spec; None always passes
+    check: Callable[[NodeState], bool] | None
+
+
+@lru_cache(maxsize=1)
+def get_gates() -> tuple[Gate, ...]:
+    """Compiled gates as immutable records, built on first use."""
+    return tuple(
+        Gate(
+            check_id=g["check_id"],
+            gate_id=g["gate_id"],
+            kind=g["kind"],
+            targets=tuple(g.get("targets", [])),
+            field=g.get("field", "decision_input"),
+            check=_compile_check(g),
+        )
+        for g in get_compiled_rules().get("gates", [])
+    )
 
-    print("Loading compiled data...", file=sys.stderr)
 
-    compiled_rules = json.loads(COMPILED_RULES_PATH.read_text(encoding="utf-8"))
-    print(
-        f"  [OK] Loaded {len(compiled_rules.get('gates', []))} gates",
-        file=sys.stderr,
-    )
+@lru_cache(maxsize=1)
+def get_gates_by_id() -> dict[str, tuple[Gate, ...]]:
+    """Gates grouped by gate_id, in compiled order."""
+    by_id: dict[str, list[Gate]] = {}
+    for gate in get_gates():
+        by_id.setdefault(gate.gate_id, []).append(gate)
+    return {gate_id: tuple(gates) for gate_id, gates in by_id.items()}
 
-    catalog_current = json.loads(CATALOG_CURRENT_PATH.read_text(encoding="utf-8"))
-    print(
-        f"  [OK] Loaded current catalog: {catalog_current['program']['version']}",
-        file=sys.stderr,
-    )
 
-    catalog_previous = json.loads(CATALOG_PREVIOUS_PATH.read_text(encoding="utf-8"))
-    print(
-        f"  [OK] Loaded previous catalog: {catalog_previous['program']['version']}",
-        file=sys.stderr,
+@lru_cache(maxsize=1)
+def get_catalog_current() -> dict[str, Any]:
+    """Current catalog, parsed on first use."""
+    return _load_json_file(CATALOG_CURRENT_PATH)
+
+
+@lru_cache(maxsize=1)
+def get_catalog_previous() -> dict[str, Any]:
+    """Previous catalog, parsed on first use."""
+    return _load_json_file(CATALOG_PREVIOUS_PATH)
+
+
+@lru_cache(maxsize=1)
+def get_catalogs_by_version() -> dict[str, dict[str, Any]]:
+    """Loaded catalogs keyed by program version (previous, then current)."""
+    return {
+        catalog["program"]["version"]: catalog
+        for catalog in (get_catalog_previous(), get_catalog_current())
+    }
+
+
+@lru_cache(maxsize=1)
+def get_advisory_titles() -> tuple[tuple[str, str], ...]:
+    """(node_id, lowercased title) of current-catalog nodes with advisory content."""
+    catalog_current = get_catalog_current()
+    titles = []
+    node_advisory = get_compiled_rules().get("advisory", {}).get("node_advisory", {})
+    for nid, meta in node_advisory.items():
+        if meta.get("present"):
+            node = _find_node_in_catalog(catalog_current, nid)
+            if node:
+                titles.append((nid, node.get("title", "").lower()))
+    return tuple(titles)
+
+
+def load_data() -> None:
+    """
+    (Re)load compiled rules and catalogs eagerly.
+
+    Tools load data lazily through the get_* accessors, so the server does not
+    call this at startup. Use it to warm the caches up front (e.g. in tests) or
+    to pick up regenerated var/ files.
+    """
+    get_compiled_rules.cache_clear()
+    get_gates.cache_clear()
+    get_gates_by_id.cache_clear()
+    get_catalog_current.cache_clear()
+    get_catalog_previous.cache_clear()
+    get_catalogs_by_version.cache_clear()
+    get_advisory_titles.cache_clear()
+    _catalog_tables_cache.clear()
+    _compute_migration_report.cache_clear()
+    _compute_catalog_diff.cache_clear()
+
+    gates = get_gates()
+    catalog_current = get_catalog_current()
+    catalog_previous = get_catalog_previous()
+
+    # One write instead of a flush per line
+    sys.stderr.write(
+        "Loading compiled data...\n"
+        f"  [OK] Loaded {len(gates)} gates\n"
+        f"  [OK] Loaded current catalog: {catalog_current['program']['version']}\n"
+        f"  [OK] Loaded previous catalog: {catalog_previous['program']['version']}\n"
     )
+    sys.stderr.flush()
 
 
 # =============================================================================
@@ -111,213 +225,226 @@ def load_data() -> None:
 # =============================================================================
 
 
-def format_gate_evaluation_markdown(result: dict[str, Any]) -> str:
-    """Format gate evaluation as plain text Markdown (no colors, no symbols)."""
-    md = f"# Gate Evaluation: {result['gate_id']}\n\n"
+def _iter_gate_evaluation_markdown(result: dict[str, Any]) -> Iterator[str]:
+    """Yield gate evaluation Markdown fragments."""
+    yield f"# Gate Evaluation: {result['gate_id']}\n\n"
 
     status = "PASS" if result["pass"] else "FAIL"
-    md += f"Status: {status}\n"
-    md += f"Checks: {result['passed']}/{result['total_checks']} passed\n\n"
+    yield f"Status: {status}\n"
+    yield f"Checks: {result['passed']}/{result['total_checks']} passed\n\n"
 
     for check in result["checks"]:
         check_status = "PASS" if check["pass"] else "FAIL"
-        md += f"## {check_status} {check['check_id']}\n"
-        md += f"- Gate: {check['gate_id']}\n"
-        md += f"- Message: {check['message']}\n"
-        md += f"- Targets: {', '.join(check['targets'])}\n"
+        yield f"## {check_status} {check['check_id']}\n"
+        yield f"- Gate: {check['gate_id']}\n"
+        yield f"- Message: {check['message']}\n"
+        yield f"- Targets: {', '.join(check['targets'])}\n"
 
         if check["failures"]:
-            md += f"- Failed nodes: {', '.join(check['failures'])}\n"
+            yield f"- Failed nodes: {', '.join(check['failures'])}\n"
+
+        yield "\n"
 
-        md += "\n"
 
-    return md
+def format_gate_evaluation_markdown(result: dict[str, Any]) -> str:
+    """Format gate evaluation as plain text Markdown (no colors, no symbols)."""
+    return "".join(_iter_gate_evaluation_markdown(result))
 
 
-def format_migration_report_markdown(report: dict[str, Any]) -> str:
-    """Format migration report as plain text Markdown."""
-    md = f"# Migration Report: {report['from_version']} -> {report['to_version']}\n\n"
+def _iter_migration_report_markdown(report: dict[str, Any]) -> Iterator[str]:
+    """Yield migration report Markdown fragments."""
+    yield f"# Migration Report: {report['from_version']} -> {report['to_version']}\n\n"
 
     compat = "COMPATIBLE" if report["compatible"] else "INCOMPATIBLE"
-    md += f"## Compatibility: {compat}\n\n"
+    yield f"## Compatibility: {compat}\n\n"
 
-    md += "## Changes\n\n"
+    yield "## Changes\n\n"
 
     # Added nodes
-    md += "### Added Nodes\n"
+    yield "### Added Nodes\n"
     if report["changes"]["added_nodes"]:
         for node in report["changes"]["added_nodes"]:
-            md += f"- {node['id']}\n"
+            yield f"- {node['id']}\n"
     else:
-        md += "No nodes added.\n"
-    md += "\n"
+        yield "No nodes added.\n"
+    yield "\n"
 
     # Removed nodes
-    md += "### Removed Nodes\n"
+    yield "### Removed Nodes\n"
     if report["changes"]["removed_nodes"]:
         for node in report["changes"]["removed_nodes"]:
-            md += f"- {node}\n"
+            yield f"- {node}\n"
     else:
-        md += "No nodes removed.\n"
-    md += "\n"
+        yield "No nodes removed.\n"
+    yield "\n"
 
     # New features
     if report["changes"]["new_advisory"]:
-        md += "### New Features\n"
-        md += "- Advisory content now available (examples, templates, anti-patterns, success criteria)\n\n"
+        yield "### New Features\n"
+        yield "- Advisory content now available (examples, templates, anti-patterns, success criteria)\n\n"
 
     # State updates
-    md += "## State Updates\n\n"
+    yield "## State Updates\n\n"
 
-    md += "### Nodes to Add\n"
+    yield "### Nodes to Add\n"
     if report["state_updates"]["nodes_to_add"]:
         for node in report["state_updates"]["nodes_to_add"]:
-            md += f"- {node}\n"
+            yield f"- {node}\n"
     else:
-        md += "No new nodes to add to state.\n"
-    md += "\n"
+        yield "No new nodes to add to state.\n"
+    yield "\n"
 
-    md += "### Advisory Available\n"
+    yield "### Advisory Available\n"
     if report["state_updates"]["advisory_available"]:
-        md += "The following nodes now have advisory content:\n"
+        yield "The following nodes now have advisory content:\n"
         for node in report["state_updates"]["advisory_available"]:
-            md += f"- {node}\n"
+            yield f"- {node}\n"
     else:
-        md += "No advisory content available.\n"
-    md += "\n"
+        yield "No advisory content available.\n"
+    yield "\n"
 
     # Warnings
-    md += "## Warnings\n"
+    yield "## Warnings\n"
     if report["warnings"]:
         for warning in report["warnings"]:
-            md += f"- {warning}\n"
+            yield f"- {warning}\n"
     else:
-        md += "No warnings.\n"
+        yield "No warnings.\n"
+
 
-    return md
+def format_migration_report_markdown(report: dict[str, Any]) -> str:
+    """Format migration report as plain text Markdown."""
+    return "".join(_iter_migration_report_markdown(report))
 
 
-def format_catalog_diff_markdown(diff: dict[str, Any]) -> str:
-    """Format catalog diff as plain text Markdown."""
-    md = f"# Catalog Diff: {diff['from_version']} -> {diff['to_version']}\n\n"
+def _iter_catalog_diff_markdown(diff: dict[str, Any]) -> Iterator[str]:
+    """Yield catalog diff Markdown fragments."""
+    yield f"# Catalog Diff: {diff['from_version']} -> {diff['to_version']}\n\n"
 
     # Fingerprints
-    md += "## Fingerprints\n"
-    md += f"- From: {diff['fingerprints']['from']}\n"
-    md += f"- To: {diff['fingerprints']['to']}\n\n"
+    yield "## Fingerprints\n"
+    yield f"- From: {diff['fingerprints']['from']}\n"
+    yield f"- To: {diff['fingerprints']['to']}\n\n"
 
     # Phases
-    md += "## Phases\n\n"
-    md += f"Added: {len(diff['phases']['added'])}\n"
-    md += f"Removed: {len(diff['phases']['removed'])}\n"
-    md += f"Unchanged: {len(diff['phases']['unchanged'])}\n\n"
+    yield "## Phases\n\n"
+    yield f"Added: {len(diff['phases']['added'])}\n"
+    yield f"Removed: {len(diff['phases']['removed'])}\n"
+    yield f"Unchanged: {len(diff['phases']['unchanged'])}\n\n"
 
     # Nodes
-    md += "## Nodes\n\n"
+    yield "## Nodes\n\n"
 
     if diff["nodes"]["added"]:
-        md += "### Added Nodes\n"
+        yield "### Added Nodes\n"
         for node in diff["nodes"]["added"]:
-            md += f"- {node['id']} (phase: {node['phase']}, door: {node['door']}, level: {node['level']})\n"
-        md += "\n"
+            yield f"- {node['id']} (phase: {node['phase']}, door: {node['door']}, level: {node['level']})\n"
+        yield "\n"
 
     if diff["nodes"]["removed"]:
-        md += "### Removed Nodes\n"
+        yield "### Removed Nodes\n"
         for node in diff["nodes"]["removed"]:
-            md += f"- {node['id']} (phase: {node['phase']})\n"
-        md += "\n"
+            yield f"- {node['id']} (phase: {node['phase']})\n"
+        yield "\n"
 
-    md += f"### Unchanged Nodes\n"
-    md += f"Count: {len(diff['nodes']['unchanged'])}\n\n"
+    yield f"### Unchanged Nodes\n"
+    yield f"Count: {len(diff['nodes']['unchanged'])}\n\n"
 
     # Gates
-    md += "## Gates\n"
-    md += f"{diff['gates']['info']}\n"
-    md += f"Total compiled: {diff['gates']['total_compiled']}\n\n"
+    yield "## Gates\n"
+    yield f"{diff['gates']['info']}\n"
+    yield f"Total compiled: {diff['gates']['total_compiled']}\n\n"
 
     # Advisory
-    md += "## Advisory\n"
-    md += f"- Available in {diff['from_version']}: {'Yes' if diff['advisory']['available_in_from'] else 'No'}\n"
-    md += f"- Available in {diff['to_version']}: {'Yes' if diff['advisory']['available_in_to'] else 'No'}\n\n"
+    yield "## Advisory\n"
+    yield f"- Available in {diff['from_version']}: {'Yes' if diff['advisory']['available_in_from'] else 'No'}\n"
+    yield f"- Available in {diff['to_version']}: {'Yes' if diff['advisory']['available_in_to'] else 'No'}\n\n"
 
     if diff["advisory"]["nodes_with_new_advisory"]:
-        md += "Nodes with new advisory:\n"
+        yield "Nodes with new advisory:\n"
         for node in diff["advisory"]["nodes_with_new_advisory"]:
-            md += f"- {node}\n"
+            yield f"- {node}\n"
+
 
-    return md
+def format_catalog_diff_markdown(diff: dict[str, Any]) -> str:
+    """Format catalog diff as plain text Markdown."""
+    return "".join(_iter_catalog_diff_markdown(diff))
 
 
-def format_advisory_suggestions_markdown(result: dict[str, Any]) -> str:
-    """Format advisory suggestions as plain text Markdown with code language hints."""
-    md = f"# Advisory Suggestions\n\n"
-    md += f"Context: {result['context']}\n\n"
+def _iter_advisory_suggestions_markdown(result: dict[str, Any]) -> Iterator[str]:
+    """Yield advisory suggestions Markdown fragments."""
+    yield f"# Advisory Suggestions\n\n"
+    yield f"Context: {result['context']}\n\n"
 
     for suggestion in result["suggestions"]:
         source = suggestion["source"]
         adv_type = suggestion["type"]
         items = suggestion["items"]
 
-        md += f"## {source.replace(':', ': ').title()}\n\n"
-        md += f"### {adv_type.replace('_', ' ').title()}\n\n"
+        yield f"## {source.replace(':', ': ').title()}\n\n"
+        yield f"### {adv_type.replace('_', ' ').title()}\n\n"
 
         for item in items:
             if adv_type == "examples":
-                md += f"#### {item['title']}\n"
-                md += f"{item['description']}\n\n"
+                yield f"#### {item['title']}\n"
+                yield f"{item['description']}\n\n"
 
                 if "code" in item and item["code"]:
                     lang = _detect_language(item["code"])
-                    md += f"```{lang}\n"
-                    md += f"{item['code']}\n"
-                    md += f"```\n\n"
+                    yield f"```{lang}\n"
+                    yield f"{item['code']}\n"
+                    yield f"```\n\n"
 
                 if "context" in item and item["context"]:
-                    md += f"Context: {item['context']}\n\n"
+                    yield f"Context: {item['context']}\n\n"
 
             elif adv_type == "templates":
-                md += f"#### {item['name']}\n\n"
+                yield f"#### {item['name']}\n\n"
                 lang = item.get("format", "text")
-                md += f"```{lang}\n"
-                md += f"{item['content']}\n"
-                md += f"```\n\n"
+                yield f"```{lang}\n"
+                yield f"{item['content']}\n"
+                yield f"```\n\n"
 
             elif adv_type == "anti_patterns":
-                md += f"#### {item['title']}\n"
-                md += f"Problem: {item['problem']}\n\n"
-                md += f"Solution: {item['solution']}\n\n"
+                yield f"#### {item['title']}\n"
+                yield f"Problem: {item['problem']}\n\n"
+                yield f"Solution: {item['solution']}\n\n"
 
                 if "example" in item and item["example"]:
-                    md += f"Example: {item['example']}\n\n"
+                    yield f"Example: {item['example']}\n\n"
 
             elif adv_type == "success_criteria":
-                md += f"#### {item['criterion']}\n"
-                md += f"Verification: {item['verification']}\n\n"
+                yield f"#### {item['criterion']}\n"
+                yield f"Verification: {item['verification']}\n\n"
 
                 if "evidence" in item and item["evidence"]:
-                    md += f"Evidence: {item['evidence']}\n\n"
+                    yield f"Evidence: {item['evidence']}\n\n"
 
-    md += f"Total items: {result['total_items']}\n"
+    yield f"Total items: {result['total_items']}\n"
 
-    return md
+
+def format_advisory_suggestions_markdown(result: dict[str, Any]) -> str:
+    """Format advisory suggestions as plain text Markdown with code language hints."""
+    return "".join(_iter_advisory_suggestions_markdown(result))
+
+
+# Ordered (language, required token, any-of tokens) rules; first match wins
+_LANGUAGE_RULES: tuple[tuple[str, str | None, tuple[str, ...]], ...] = (
+    ("python", None, ("def ", "import ", "@")),
+    ("json", "{", ('"name"', '"version"')),
+    ("toml", None, ("[project]", "[tool.")),
+    ("javascript", None, ("function", "const", "=>")),
+    ("markdown", None, ("```",)),
+)
 
 
+@lru_cache(maxsize=512)
 def _detect_language(code: str) -> str:
     """Detect programming language from code content for syntax highlighting."""
-    code_lower = code.lower()
-
-    if "def " in code or "import " in code or "@" in code:
-        return "python"
-    elif "{" in code and ('"name"' in code or '"version"' in code):
-        return "json"
-    elif "[project]" in code or "[tool." in code:
-        return "toml"
-    elif "function" in code or "const" in code or "=>" in code:
-        return "javascript"
-    elif "```" in code:
-        return "markdown"
-    else:
-        return "text"
+    for lang, required, tokens in _LANGUAGE_RULES:
+        if (required is None or required in code) and any(t in code for t in tokens):
+            return lang
+    return "text"
 
 
 # =============================================================================
@@ -325,156 +452,376 @@ def _detect_language(code: str) -> str:
 # =============================================================================
 
 
+def _parse_condition(
+    condition: str | None,
+) -> tuple[str | None, str | None, str | None]:
+    """
+    Parse a condition token into (kind, ev_type, ev_result).
+
+    kind is "done", "evidence", "contract" or None (unknown/absent condition).
+    """
+    if condition == "status.state == done":
+        return "done", None, None
+    if condition and condition.startswith("has_evidence:"):
+        # Parse: has_evidence:<type>[:result]
+        parts = condition.split(":")
+        return "evidence", parts[1], parts[2] if len(parts) > 2 else None
+    if condition == "has_contract":
+        return "contract", None, None
+    return None, None, None
+
+
+def _make_evidence_check(
+    ev_type: str | None, ev_result: str | None
+) -> Callable[[NodeState], bool]:
+    """Predicate: node has evidence of ev_type (and ev_result, if given)."""
+
+    def has_evidence(node_state: NodeState) -> bool:
+        for ev in node_state.evidence_by_type.get(ev_type, ()):
+            if ev_result is None or ev.result == ev_result:
+                return True
+        return False
+
+    return has_evidence
+
+
+def _compile_check(gate: dict[str, Any]) -> Callable[[NodeState], bool] | None:
+    """Compile a raw gate's condition/spec into a per-target predicate."""
+    kind = gate["kind"]
+
+    if kind == "all-of":
+        cond_kind, ev_type, ev_result = _parse_condition(gate.get("condition_token"))
+        if cond_kind == "done":
+            return lambda ns: ns.status.state == "done"
+        if cond_kind == "evidence":
+            return _make_evidence_check(ev_type, ev_result)
+        if cond_kind == "contract":
+            return lambda ns: ns.decision_input is not None
+
+    elif kind == "node-field-present":
+        if gate.get("field", "decision_input") == "decision_input":
+            return lambda ns: ns.decision_input is not None
+
+    elif kind == "evidence-meets":
+        evidence_spec = gate.get("evidence_spec")
+        if evidence_spec:
+            return _make_evidence_check(
+                evidence_spec.get("type"), evidence_spec.get("result")
+            )
+
+    return None
+
+
 def _evaluate_check(
-    gate: dict[str, Any], state: ClientState
+    gate: Gate, state: ClientState
 ) -> tuple[bool, str, list[str]]:
     """Evaluate a single gate check against client state."""
-    kind = gate["kind"]
-    targets = gate.get("targets", [])
-    condition = gate.get("condition_token")
-    evidence_spec = gate.get("evidence_spec")
-    nodes = state.nodes
+    kind = gate.kind
+
+    if kind in ("adr-has-section", "artifact-exists"):
+        # These require external artifact inspection - return advisory
+        return True, f"Check '{kind}' requires external validation", []
+
+    if kind not in ("all-of", "node-field-present", "evidence-meets"):
+        return True, f"Check kind '{kind}' not fully implemented", []
 
+    # Every target must exist in the state and satisfy the compiled check
+    nodes = state.nodes
+    check = gate.check
     failures = []
+    for target in gate.targets:
+        node_state = nodes.get(target)
+        if node_state is None or (check is not None and not check(node_state)):
+            failures.append(target)
 
     if kind == "all-of":
-        # All targets must satisfy condition
-        for target in targets:
-            node_state = nodes.get(target)
-
-            if not node_state:
-                failures.append(target)
-                continue
-
-            if condition == "status.state == done":
-                if node_state.status.state != "done":
-                    failures.append(target)
-
-            elif condition and condition.startswith("has_evidence:"):
-                # Parse: has_evidence:<type>[:result]
-                parts = condition.split(":")
-                ev_type = parts[1]
-                ev_result = parts[2] if len(parts) > 2 else None
-
-                evidence_list = node_state.evidence
-                found = False
-                for ev in evidence_list:
-                    if ev.type == ev_type:
-                        if ev_result is None or ev.result == ev_result:
-                            found = True
-                            break
-
-                if not found:
-                    failures.append(target)
-
-            elif condition == "has_contract":
-                if node_state.decision_input is None:
-                    failures.append(target)
-
         if failures:
             return False, f"Failed for: {', '.join(failures)}", failures
         return True, "All targets satisfy condition", []
 
-    elif kind == "node-field-present":
-        # Check if field present in target nodes
-        field = gate.get("field", "decision_input")
-        for target in targets:
-            node_state = nodes.get(target)
-            if not node_state:
-                failures.append(target)
-                continue
-
-            if field == "decision_input" and node_state.decision_input is None:
-                failures.append(target)
-
+    if kind == "node-field-present":
+        field = gate.field
         if failures:
             return False, f"Missing field '{field}' in: {', '.join(failures)}", failures
         return True, f"Field '{field}' present in all targets", []
 
-    elif kind == "evidence-meets":
-        # Check evidence meets criteria
-        for target in targets:
-            node_state = nodes.get(target)
-            if not node_state:
-                failures.append(target)
-                continue
+    if failures:
+        return (
+            False,
+            f"Evidence not found for: {', '.join(failures)}",
+            failures,
+        )
+    return True, "Evidence meets criteria", []
 
-            evidence_list = node_state.evidence
 
-            if evidence_spec:
-                ev_type = evidence_spec.get("type")
-                ev_result = evidence_spec.get("result")
+@dataclass(frozen=True, slots=True)
+class NodeDetails:
+    """Column-oriented node details of a catalog, in catalog order."""
 
-                found = False
-                for ev in evidence_list:
-                    if ev.type == ev_type:
-                        if ev_result is None or ev.result == ev_result:
-                            found = True
-                            break
+    ids: tuple[str, ...]
+    phases: tuple[str, ...]
+    doors: tuple[str, ...]
+    levels: tuple[str, ...]
 
-                if not found:
-                    failures.append(target)
 
-        if failures:
-            return (
-                False,
-                f"Evidence not found for: {', '.join(failures)}",
-                failures,
-            )
-        return True, "Evidence meets criteria", []
+@dataclass(frozen=True, slots=True)
+class CatalogTables:
+    """Node/phase lookup tables for one catalog."""
 
-    elif kind in ("adr-has-section", "artifact-exists"):
-        # These require external artifact inspection - return advisory
-        return True, f"Check '{kind}' requires external validation", []
+    nodes_by_id: dict[str, dict[str, Any]]
+    phases_by_id: dict[str, dict[str, Any]]
+    node_ids: frozenset[str]
+    phase_ids: frozenset[str]
+    node_details: NodeDetails
 
-    return True, f"Check kind '{kind}' not fully implemented", []
 
+# Per-catalog lookup tables, keyed by id(catalog); cleared by load_data().
+# Each entry keeps its catalog so the id cannot be reused by another dict.
+_catalog_tables_cache: dict[int, tuple[dict[str, Any], CatalogTables]] = {}
 
-def _extract_node_ids(catalog: dict[str, Any]) -> set[str]:
-    """Extract all node IDs from a catalog."""
-    node_ids = set()
-    for phase in catalog.get("phases", []):
-        for node in phase.get("nodes", []):
-            node_ids.add(node["id"])
-    return node_ids
 
+def _get_catalog_tables(catalog: dict[str, Any]) -> CatalogTables:
+    """Build (once per catalog) node/phase lookup tables for O(1) access."""
+    cached = _catalog_tables_cache.get(id(catalog))
+    if cached is not None and cached[0] is catalog:
+        return cached[1]
 
-def _get_node_details(catalog: dict[str, Any]) -> list[dict[str, Any]]:
-    """Extract node details from catalog."""
-    nodes = []
+    nodes: dict[str, dict[str, Any]] = {}
+    phases: dict[str, dict[str, Any]] = {}
+    ids: list[str] = []
+    node_phases: list[str] = []
+    doors: list[str] = []
+    levels: list[str] = []
     for phase in catalog.get("phases", []):
         phase_id = phase["id"]
+        phases.setdefault(phase_id, phase)
         for node in phase.get("nodes", []):
-            nodes.append(
-                {
-                    "id": node["id"],
-                    "phase": phase_id,
-                    "door": node.get("door", ""),
-                    "level": node.get("level", ""),
-                }
-            )
-    return nodes
+            nodes.setdefault(node["id"], node)
+            ids.append(node["id"])
+            node_phases.append(phase_id)
+            doors.append(node.get("door", ""))
+            levels.append(node.get("level", ""))
+
+    tables = CatalogTables(
+        nodes_by_id=nodes,
+        phases_by_id=phases,
+        node_ids=frozenset(nodes),
+        phase_ids=frozenset(phases),
+        node_details=NodeDetails(
+            tuple(ids), tuple(node_phases), tuple(doors), tuple(levels)
+        ),
+    )
+    _catalog_tables_cache[id(catalog)] = (catalog, tables)
+    return tables
+
+
+def _extract_node_ids(catalog: dict[str, Any]) -> frozenset[str]:
+    """Extract all node IDs from a catalog."""
+    return _get_catalog_tables(catalog).node_ids
+
+
+def _extract_phase_ids(catalog: dict[str, Any]) -> frozenset[str]:
+    """Extract all phase IDs from a catalog."""
+    return _get_catalog_tables(catalog).phase_ids
+
+
+def _get_node_details(catalog: dict[str, Any]) -> NodeDetails:
+    """Extract node details from catalog."""
+    return _get_catalog_tables(catalog).node_details
 
 
 def _find_node_in_catalog(
     catalog: dict[str, Any], node_id: str
 ) -> dict[str, Any] | None:
     """Find a node by ID in a catalog."""
-    for phase in catalog.get("phases", []):
-        for node in phase.get("nodes", []):
-            if node["id"] == node_id:
-                return node
-    return None
+    return _get_catalog_tables(catalog).nodes_by_id.get(node_id)
 
 
 def _find_phase_in_catalog(
     catalog: dict[str, Any], phase_id: str
 ) -> dict[str, Any] | None:
     """Find a phase by ID in a catalog."""
-    for phase in catalog.get("phases", []):
-        if phase["id"] == phase_id:
-            return phase
-    return None
+    return _get_catalog_tables(catalog).phases_by_id.get(phase_id)
+
+
+# Migration reports and diffs depend only on the version pair and the loaded
+# data, so they are cached per pair and cleared by load_data(). Callers must
+# not mutate the returned dicts.
+
+
+@lru_cache(maxsize=8)
+def _compute_migration_report(from_version: str, to_version: str) -> dict[str, Any]:
+    """Build the migration report (or an error dict) for a version pair."""
+    compiled_rules = get_compiled_rules()
+    catalogs = get_catalogs_by_version()
+
+    from_catalog = catalogs.get(from_version)
+    if from_catalog is None:
+        return {
+            "error": f"Unknown from_version: {from_version}",
+            "available_versions": list(catalogs),
+        }
+
+    to_catalog = catalogs.get(to_version)
+    if to_catalog is None:
+        return {
+            "error": f"Unknown to_version: {to_version}",
+            "available_versions": list(catalogs),
+        }
+
+    # Extract nodes from both catalogs
+    from_nodes = _extract_node_ids(from_catalog)
+    to_nodes = _extract_node_ids(to_catalog)
+
+    # Sort each difference once; every list below reuses it
+    added_nodes = sorted(to_nodes - from_nodes)
+    removed_nodes = sorted(from_nodes - to_nodes)
+
+    # Check advisory availability
+    advisory_reg = compiled_rules.get("advisory", {}).get("node_advisory", {})
+    nodes_with_advisory = [
+        node_id
+        for node_id in added_nodes
+        if advisory_reg.get(node_id, {}).get("present")
+    ]
+
+    # Build migration report
+    report = {
+        "from_version": from_version,
+        "to_version": to_version,
+        "changes": {
+            "added_nodes": [
+                {"id": node_id, "info": "New node in target version"}
+                for node_id in added_nodes
+            ],
+            "removed_nodes": removed_nodes,
+            "new_advisory": to_version == get_catalog_current()["program"]["version"],
+        },
+        "state_updates": {
+            "nodes_to_add": added_nodes,
+            "nodes_to_review": [],  # Future: gate diff analysis
+            "advisory_available": nodes_with_advisory,
+        },
+        "compatible": not removed_nodes,
+        "warnings": [
+            f"Node '{node}' removed in target version" for node in removed_nodes
+        ],
+    }
+
+    return report
+
+
+@lru_cache(maxsize=8)
+def _compute_catalog_diff(from_version: str, to_version: str) -> dict[str, Any]:
+    """Build the structural diff (or an error dict) for a version pair."""
+    compiled_rules = get_compiled_rules()
+    catalogs = get_catalogs_by_version()
+
+    from_catalog = catalogs.get(from_version)
+    if from_catalog is None:
+        return {
+            "error": f"Unknown from_version: {from_version}",
+            "available_versions": list(catalogs),
+        }
+
+    to_catalog = catalogs.get(to_version)
+    if to_catalog is None:
+        return {
+            "error": f"Unknown to_version: {to_version}",
+            "available_versions": list(catalogs),
+        }
+
+    # Extract structures (precomputed per catalog)
+    from_phases = _extract_phase_ids(from_catalog)
+    to_phases = _extract_phase_ids(to_catalog)
+
+    from_nodes = _get_node_details(from_catalog)
+    to_nodes = _get_node_details(to_catalog)
+
+    from_node_ids = _extract_node_ids(from_catalog)
+    to_node_ids = _extract_node_ids(to_catalog)
+    added_node_ids = to_node_ids - from_node_ids
+    removed_node_ids = from_node_ids - to_node_ids
+
+    # Advisory check
+    from_has_advisory = (
+        "advisory" in next(iter(from_catalog.get("phases", [])), {})
+        if from_catalog.get("phases")
+        else False
+    )
+    to_has_advisory = (
+        "advisory" in next(iter(to_catalog.get("phases", [])), {})
+        if to_catalog.get("phases")
+        else False
+    )
+
+    advisory_reg = compiled_rules.get("advisory", {}).get("node_advisory", {})
+    nodes_with_new_advisory = [
+        node_id
+        for node_id in added_node_ids
+        if advisory_reg.get(node_id, {}).get("present")
+    ]
+
+    diff = {
+        "from_version": from_version,
+        "to_version": to_version,
+        "fingerprints": {
+            "from": from_catalog["program"]["fingerprint"],
+            "to": to_catalog["program"]["fingerprint"],
+        },
+        "phases": {
+            "added": sorted(to_phases - from_phases),
+            "removed": sorted(from_phases - to_phases),
+            "unchanged": sorted(from_phases & to_phases),
+        },
+        "nodes": {
+            "added": [
+                {"id": node_id, "phase": phase, "door": door, "level": level}
+                for node_id, phase, door, level in zip(
+                    to_nodes.ids, to_nodes.phases, to_nodes.doors, to_nodes.levels
+                )
+                if node_id in added_node_ids
+            ],
+            "removed": [
+                {"id": node_id, "phase": phase}
+                for node_id, phase in zip(from_nodes.ids, from_nodes.phases)
+                if node_id in removed_node_ids
+            ],
+            "unchanged": sorted(from_node_ids & to_node_ids),
+        },
+        "gates": {
+            "info": "Gate diff requires compiled gate comparison",
+            "total_compiled": len(get_gates()),
+        },
+        "advisory": {
+            "available_in_from": from_has_advisory,
+            "available_in_to": to_has_advisory,
+            "nodes_with_new_advisory": nodes_with_new_advisory,
+        },
+    }
+
+    return diff
+
+
+def _match_context_nodes(
+    keywords: list[str], advisory_types: list[str]
+) -> list[dict[str, Any]]:
+    """Advisory suggestions for current-catalog nodes whose title has a keyword."""
+    catalog_current = get_catalog_current()
+    find_node = _find_node_in_catalog
+
+    suggestions = []
+    for nid, title in get_advisory_titles():
+        if not any(kw in title for kw in keywords):
+            continue
+        node_advisory = find_node(catalog_current, nid).get("advisory", {})
+        for adv_type in advisory_types:
+            items = node_advisory.get(adv_type, [])
+            if items:
+                suggestions.append(
+                    {"source": f"node:{nid}", "type": adv_type, "items": items}
+                )
+    return suggestions
 
 
 # =============================================================================
@@ -518,47 +865,48 @@ def evaluate_gate(
     """
     try:
         # Validate state with Pydantic
-        validated_state = ClientState(**state) if state else ClientState()
+        validated_state = ClientState.model_validate(state or {})
     except Exception as e:
         return {"error": "Validation error", "details": str(e)}
 
-    gates = compiled_rules.get("gates", [])
-
-    # Filter gates
+    # Select gates
     if gate_id:
-        target_gates = [g for g in gates if g["gate_id"] == gate_id]
+        gates_by_id = get_gates_by_id()
+        target_gates = gates_by_id.get(gate_id)
         if not target_gates:
-            valid_gates = sorted(set(g["gate_id"] for g in gates))
+            valid_gates = sorted(gates_by_id)
             return {"error": f"Unknown gate_id: {gate_id}", "valid_gates": valid_gates}
     else:
-        target_gates = gates
+        target_gates = get_gates()
         gate_id = "all"
 
     # Evaluate checks
     checks = []
-    all_pass = True
+    passed = failed = 0
 
     for gate in target_gates:
         check_pass, message, failures = _evaluate_check(gate, validated_state)
         checks.append(
             {
-                "check_id": gate["check_id"],
-                "gate_id": gate["gate_id"],
+                "check_id": gate.check_id,
+                "gate_id": gate.gate_id,
                 "pass": check_pass,
                 "message": message,
-                "targets": gate.get("targets", []),
+                "targets": list(gate.targets),
                 "failures": failures,
             }
         )
-        if not check_pass:
-            all_pass = False
+        if check_pass:
+            passed += 1
+        else:
+            failed += 1
 
     result = {
         "gate_id": gate_id,
-        "pass": all_pass,
+        "pass": failed == 0,
         "total_checks": len(checks),
-        "passed": sum(1 for c in checks if c["pass"]),
-        "failed": sum(1 for c in checks if not c["pass"]),
+        "passed": passed,
+        "failed": failed,
         "checks": checks,
     }
 
@@ -602,73 +950,13 @@ def migrate_state(
     """
     try:
         # Validate state with Pydantic
-        ClientState(**state)
+        ClientState.model_validate(state)
     except Exception as e:
         return {"error": "Validation error", "details": str(e)}
 
-    # Determine which catalogs to use
-    available_versions = [
-        catalog_previous["program"]["version"],
-        catalog_current["program"]["version"],
-    ]
-
-    if from_version == catalog_previous["program"]["version"]:
-        from_catalog = catalog_previous
-    elif from_version == catalog_current["program"]["version"]:
-        from_catalog = catalog_current
-    else:
-        return {
-            "error": f"Unknown from_version: {from_version}",
-            "available_versions": available_versions,
-        }
-
-    if to_version == catalog_current["program"]["version"]:
-        to_catalog = catalog_current
-    elif to_version == catalog_previous["program"]["version"]:
-        to_catalog = catalog_previous
-    else:
-        return {
-            "error": f"Unknown to_version: {to_version}",
-            "available_versions": available_versions,
-        }
-
-    # Extract nodes from both catalogs
-    from_nodes = _extract_node_ids(from_catalog)
-    to_nodes = _extract_node_ids(to_catalog)
-
-    added_nodes = to_nodes - from_nodes
-    removed_nodes = from_nodes - to_nodes
-
-    # Check advisory availability
-    advisory_reg = compiled_rules.get("advisory", {}).get("node_advisory", {})
-    nodes_with_advisory = [
-        node_id
-        for node_id in added_nodes
-        if advisory_reg.get(node_id, {}).get("present")
-    ]
-
-    # Build migration report
-    report = {
-        "from_version": from_version,
-        "to_version": to_version,
-        "changes": {
-            "added_nodes": [
-                {"id": node_id, "info": "New node in target version"}
-                for node_id in sorted(added_nodes)
-            ],
-            "removed_nodes": list(sorted(removed_nodes)),
-            "new_advisory": to_version == catalog_current["program"]["version"],
-        },
-        "state_updates": {
-            "nodes_to_add": list(sorted(added_nodes)),
-            "nodes_to_review": [],  # Future: gate diff analysis
-            "advisory_available": nodes_with_advisory,
-        },
-        "compatible": len(removed_nodes) == 0,
-        "warnings": [
-            f"Node '{node}' removed in target version" for node in removed_nodes
-        ],
-    }
+    report = _compute_migration_report(from_version, to_version)
+    if "error" in report:
+        return report
 
     if format == "markdown":
         return format_migration_report_markdown(report)
@@ -703,101 +991,9 @@ def diff_catalogs(
     Errors:
         - Unknown version: Returns error with available versions
     """
-    available_versions = [
-        catalog_previous["program"]["version"],
-        catalog_current["program"]["version"],
-    ]
-
-    # Load catalogs
-    if from_version == catalog_previous["program"]["version"]:
-        from_catalog = catalog_previous
-    elif from_version == catalog_current["program"]["version"]:
-        from_catalog = catalog_current
-    else:
-        return {
-            "error": f"Unknown from_version: {from_version}",
-            "available_versions": available_versions,
-        }
-
-    if to_version == catalog_current["program"]["version"]:
-        to_catalog = catalog_current
-    elif to_version == catalog_previous["program"]["version"]:
-        to_catalog = catalog_previous
-    else:
-        return {
-            "error": f"Unknown to_version: {to_version}",
-            "available_versions": available_versions,
-        }
-
-    # Extract structures
-    from_phases = {p["id"] for p in from_catalog.get("phases", [])}
-    to_phases = {p["id"] for p in to_catalog.get("phases", [])}
-
-    from_nodes = _get_node_details(from_catalog)
-    to_nodes = _get_node_details(to_catalog)
-
-    from_node_ids = {n["id"] for n in from_nodes}
-    to_node_ids = {n["id"] for n in to_nodes}
-
-    # Advisory check
-    from_has_advisory = (
-        "advisory" in next(iter(from_catalog.get("phases", [])), {})
-        if from_catalog.get("phases")
-        else False
-    )
-    to_has_advisory = (
-        "advisory" in next(iter(to_catalog.get("phases", [])), {})
-        if to_catalog.get("phases")
-        else False
-    )
-
-    advisory_reg = compiled_rules.get("advisory", {}).get("node_advisory", {})
-    nodes_with_new_advisory = [
-        node_id
-        for node_id in (to_node_ids - from_node_ids)
-        if advisory_reg.get(node_id, {}).get("present")
-    ]
-
-    diff = {
-        "from_version": from_version,
-        "to_version": to_version,
-        "fingerprints": {
-            "from": from_catalog["program"]["fingerprint"],
-            "to": to_catalog["program"]["fingerprint"],
-        },
-        "phases": {
-            "added": list(sorted(to_phases - from_phases)),
-            "removed": list(sorted(from_phases - to_phases)),
-            "unchanged": list(sorted(from_phases & to_phases)),
-        },
-        "nodes": {
-            "added": [
-                {
-                    "id": n["id"],
-                    "phase": n["phase"],
-                    "door": n["door"],
-                    "level": n["level"],
-                }
-                for n in to_nodes
-                if n["id"] in (to_node_ids - from_node_ids)
-            ],
-            "removed": [
-                {"id": n["id"], "phase": n["phase"]}
-                for n in from_nodes
-                if n["id"] in (from_node_ids - to_node_ids)
-            ],
-            "unchanged": list(sorted(from_node_ids & to_node_ids)),
-        },
-        "gates": {
-            "info": "Gate diff requires compiled gate comparison",
-            "total_compiled": len(compiled_rules.get("gates", [])),
-        },
-        "advisory": {
-            "available_in_from": from_has_advisory,
-            "available_in_to": to_has_advisory,
-            "nodes_with_new_advisory": nodes_with_new_advisory,
-        },
-    }
+    diff = _compute_catalog_diff(from_version, to_version)
+    if "error" in diff:
+        return diff
 
     if format == "markdown":
         return format_catalog_diff_markdown(diff)
@@ -843,6 +1039,9 @@ def suggest_advisory(
         - Unknown node/phase: Returns error with valid IDs
         - No advisory available: Returns empty suggestions
     """
+    compiled_rules = get_compiled_rules()
+    catalog_current = get_catalog_current()
+
     suggestions = []
 
     # Load from current catalog (has advisory)
@@ -859,7 +1058,7 @@ def suggest_advisory(
             )
             return {
                 "error": f"Unknown node_id: {node_id}",
-                "valid_nodes": list(sorted(valid_nodes)),
+                "valid_nodes": sorted(valid_nodes),
             }
 
         node_advisory = node.get("advisory", {})
@@ -908,28 +1107,10 @@ def suggest_advisory(
 
     # If no specific node/phase, search by context
     if not node_id and not phase_id:
-        # Simple keyword matching in advisory registry
-        context_lower = context.lower()
-        advisory_reg = compiled_rules.get("advisory", {})
-
-        # Check nodes with advisory
-        for nid, meta in advisory_reg.get("node_advisory", {}).items():
-            if meta.get("present"):
-                node = _find_node_in_catalog(catalog_current, nid)
-                if node and any(
-                    kw in node.get("title", "").lower() for kw in context_lower.split()
-                ):
-                    node_advisory = node.get("advisory", {})
-                    for adv_type in advisory_types:
-                        items = node_advisory.get(adv_type, [])
-                        if items:
-                            suggestions.append(
-                                {
-                                    "source": f"node:{nid}",
-                                    "type": adv_type,
-                                    "items": items,
-                                }
-                            )
+        # Simple keyword matching against advisory node titles
+        suggestions.extend(
+            _match_context_nodes(context.lower().split(), advisory_types)
+        )
 
     result = {
         "context": context,
@@ -947,8 +1128,6 @@ def suggest_advisory(
 # =============================================================================
 
 if __name__ == "__main__":
-    # Load data at startup
-    load_data()
-
+    # Catalogs and rules load lazily on first tool call, keeping startup fast
     # Run server (stdio by default, HTTP via --transport http)
     mcp.run()
@@ -1,8 +1,10 @@
 """
 Stage 3: Compile
 
-Build indices, partially compile predicates, create advisory registry
+Build indices, partially compile predicates, create advisory registry.
+Skipped when the catalog and compiler sources are unchanged since the last run.
 """
+import hashlib
 import sys
 from pathlib import Path
 
@@ -62,13 +64,34 @@ def build_advisory_registry(catalog: dict) -> dict:
     return registry
 
 
+def inputs_hash(catalog_path: Path) -> str:
+    """BLAKE2b over the current catalog and the compiler sources."""
+    h = hashlib.blake2b()
+    for path in (catalog_path, Path(__file__), Path(__file__).parent / "utils.py"):
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
 def main():
     try:
         var_dir = Path(__file__).parent.parent / "var"
+        catalog_path = var_dir / "catalog.current.json"
+        compiled_path = var_dir / "compiled.rules.json"
+        hash_path = var_dir / "compiled.rules.hash"
+
+        # Skip if compiled rules were built from identical inputs
+        input_hash = inputs_hash(catalog_path)
+        if (
+            compiled_path.exists()
+            and hash_path.exists()
+            and hash_path.read_text(encoding='utf-8').strip() == input_hash
+        ):
+            print(f"[OK] {compiled_path.name} is up to date, skipping compilation")
+            return 0
 
         # Load current catalog only
         print("Loading current catalog...")
-        current = load_json(var_dir / "catalog.current.json")
+        current = load_json(catalog_path)
         print(f"  Version: {current['program']['version']}")
 
         # Build indices
@@ -138,7 +161,6 @@ def main():
         print(f"  [OK] Nodes with advisory: {node_count}/{len(advisory['node_advisory'])}")
 
         # Save compiled rules
-        compiled_path = var_dir / "compiled.rules.json"
         print(f"Writing: {compiled_path}")
 
         compiled = {
@@ -148,6 +170,7 @@ def main():
         }
 
         save_json(compiled_path, compiled)
+        hash_path.write_text(input_hash + "\n", encoding='utf-8')
 
         print("[OK] Compilation complete")
         return 0
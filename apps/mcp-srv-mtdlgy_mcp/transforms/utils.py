@@ -4,6 +4,17 @@ import re
 from pathlib import Path
 from typing import Any
 
+# Optional speedup. For the catalog data (strings, small ints, no floats) both
+# paths write the same bytes; orjson formats floats differently (1e-05 vs
+# 0.00001) and save_json falls back to the stdlib for values it rejects.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# SHA-256 fingerprint: exactly 64 lowercase hex chars
+_FINGERPRINT_RE = re.compile(r'^[a-f0-9]{64}$')
+
 
 # ============================================================================
 # I/O Functions
@@ -11,12 +22,24 @@ from typing import Any
 
 def load_json(path: str | Path) -> dict[str, Any]:
     """Load JSON from file with UTF-8 encoding."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 def save_json(path: str | Path, data: dict[str, Any]) -> None:
     """Save JSON to file with UTF-8 encoding, stable key order, indent=2."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except TypeError:  # e.g. integers beyond 64 bits or non-str keys
+            pass
+        else:
+            with open(path, 'wb') as f:
+                f.write(encoded)
+            return
     with open(path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
 
@@ -118,7 +141,7 @@ def validate_fingerprint(fp: Any) -> None:
     if not isinstance(fp, str):
         raise ValueError(f"Fingerprint must be string, got {type(fp)}")
 
-    if not re.match(r'^[a-f0-9]{64}$', fp):
+    if not _FINGERPRINT_RE.match(fp):
         raise ValueError(f"Fingerprint must be 64 lowercase hex chars, got: {fp}")
 
 
@@ -1,11 +1,21 @@
 """Configuration loading and management."""
 
 import os
+import re
 import yaml
 from pathlib import Path
 from typing import Dict, Any, List
 from urllib.parse import urlparse
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Matches ${VAR_NAME} references for environment expansion
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
 
 class Config:
     """Configuration manager for sitemap crawler."""
@@ -26,7 +36,7 @@ class Config:
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
 
         # Expand environment variables in config
         config = self._expand_env_vars(config)
@@ -46,9 +56,7 @@ class Config:
         elif isinstance(obj, str):
             # Expand ${VAR} patterns
             if "${" in obj:
-                import re
-                pattern = r'\$\{([^}]+)\}'
-                matches = re.findall(pattern, obj)
+                matches = _ENV_VAR_RE.findall(obj)
                 for var_name in matches:
                     var_value = os.environ.get(var_name, "")
                     obj = obj.replace(f"${{{var_name}}}", var_value)
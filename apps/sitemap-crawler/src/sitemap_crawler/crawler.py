@@ -60,9 +60,16 @@ class SitemapCrawler:
         self.http_config = http_config or {}
         self.limits_config = limits_config or {}
 
+        # Pooled HTTP session shared by sitemap and robots.txt fetches
+        self.session = requests.Session()
+
         # Initialize robots.txt handler
         user_agent = http_config.get("user_agent", "sitemap-crawler/0.2.0") if http_config else "sitemap-crawler/0.2.0"
-        self.robots_handler = RobotsHandler(robots_config or {}, user_agent=user_agent)
+        self.robots_handler = RobotsHandler(
+            robots_config or {},
+            user_agent=user_agent,
+            session=self.session
+        )
 
         # Store browser config for crawl4ai
         self.browser_config = browser_config
@@ -158,6 +165,7 @@ class SitemapCrawler:
             return self.metrics.to_dict()
 
         finally:
+            self.session.close()
             unbind_context("site")
 
     def _get_urls(self) -> List[str]:
@@ -183,7 +191,7 @@ class SitemapCrawler:
 
             # Fetch with retry logic
             def fetch_sitemap():
-                response = requests.get(
+                response = self.session.get(
                     source_url,
                     headers=self._get_request_headers(),
                     timeout=self._get_request_timeout()
@@ -241,7 +249,7 @@ class SitemapCrawler:
 
                         # Fetch with retry logic
                         def fetch_sub_sitemap():
-                            response = requests.get(
+                            response = self.session.get(
                                 sub_url,
                                 headers=self._get_request_headers(),
                                 timeout=self._get_request_timeout()
@@ -4,6 +4,9 @@ import re
 from typing import List
 from .base import BaseParser
 
+# Markdown link: [text](url)
+_MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
 
 class LlmsTxtParser(BaseParser):
     """Parser for llms.txt format (newline-separated URLs or markdown links)."""
@@ -37,7 +40,7 @@ class LlmsTxtParser(BaseParser):
                 continue
 
             # Extract URLs from markdown links: [text](url)
-            markdown_links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', line)
+            markdown_links = _MARKDOWN_LINK_RE.findall(line)
             for title, url in markdown_links:
                 if url.startswith("http://") or url.startswith("https://"):
                     urls.append(url)
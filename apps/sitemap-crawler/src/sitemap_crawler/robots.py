@@ -13,16 +13,25 @@ logger = get_logger(__name__)
 class RobotsHandler:
     """Handle robots.txt fetching, parsing, and compliance checking."""
 
-    def __init__(self, config: Dict[str, any], user_agent: str = "sitemap-crawler/0.2.0"):
+    def __init__(
+        self,
+        config: Dict[str, any],
+        user_agent: str = "sitemap-crawler/0.2.0",
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize robots.txt handler.
 
         Args:
             config: robots.txt configuration dict
             user_agent: User-Agent string to use for robots.txt checks
+            session: Shared HTTP session, left open for its owner to close
+                (a private one is created if omitted and closed by close())
         """
         self.enabled = config.get("enabled", True)
         self.user_agent = user_agent
+        self._owns_session = session is None
+        self.session = requests.Session() if session is None else session
         self.cache_duration = config.get("cache_duration", 3600)  # 1 hour default
         self.respect_crawl_delay = config.get("respect_crawl_delay", True)
 
@@ -152,7 +161,7 @@ class RobotsHandler:
         try:
             logger.debug("fetching_robots_txt", url=robots_url)
 
-            response = requests.get(
+            response = self.session.get(
                 robots_url,
                 timeout=10,
                 headers={"User-Agent": self.user_agent}
@@ -200,3 +209,14 @@ class RobotsHandler:
         """Clear robots.txt cache."""
         self._cache.clear()
         logger.debug("robots_cache_cleared")
+
+    def close(self):
+        """Close the HTTP session if this handler created it."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "RobotsHandler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -98,8 +98,8 @@ async def echo_structured_handler(arguments: dict) -> list[TextContent]:
     if uppercase:
         text = text.upper()
 
-    # Repeat text
-    result = "\n".join([text] * count)
+    # Repeat text, newline-separated, in a single string multiply
+    result = text if count == 1 else (text + "\n") * (count - 1) + text
 
     # Return with metadata
     metadata = f"Repeated {count} time(s), Uppercase: {uppercase}"
@@ -16,7 +16,6 @@ def test_create_echo_tools():
     assert tools[1].name == "echo_structured"
 
 
-@pytest.mark.asyncio
 async def test_echo_handler():
     """Test simple echo handler."""
     result = await echo_handler({"text": "Hello"})
@@ -24,7 +23,6 @@ async def test_echo_handler():
     assert "Echo: Hello" in result[0].text
 
 
-@pytest.mark.asyncio
 async def test_echo_structured_simple():
     """Test structured echo with defaults."""
     result = await echo_structured_handler({"text": "Test"})
@@ -32,14 +30,12 @@ async def test_echo_structured_simple():
     assert "Test" in result[0].text
 
 
-@pytest.mark.asyncio
 async def test_echo_structured_uppercase():
     """Test structured echo with uppercase."""
     result = await echo_structured_handler({"text": "hello", "uppercase": True})
     assert "HELLO" in result[0].text
 
 
-@pytest.mark.asyncio
 async def test_echo_structured_repeat():
     """Test structured echo with repetition."""
     result = await echo_structured_handler({"text": "Test", "count": 3})
@@ -47,7 +43,18 @@ async def test_echo_structured_repeat():
     assert text.count("Test") == 3
 
 
-@pytest.mark.asyncio
+async def test_echo_structured_repeat_separator():
+    """Test repetitions are newline-separated without a trailing newline."""
+    result = await echo_structured_handler({"text": "ab", "count": 3})
+    assert result[0].text == "ab\nab\nab"
+
+
+async def test_echo_structured_rejects_non_string_text():
+    """Test structured echo validates text passed straight through."""
+    with pytest.raises(ValueError):
+        await echo_structured_handler({"text": None})
+
+
 async def test_echo_structured_invalid_count():
     """Test structured echo with invalid count."""
     with pytest.raises(ValueError, match="count must be between"):
@@ -12,17 +12,16 @@ def test_create_hello_tool():
     assert "properties" in tool.inputSchema
 
 
-@pytest.mark.asyncio
-async def test_hello_handler_default():
-    """Test hello handler with default name."""
-    result = await hello_handler({})
+@pytest.mark.parametrize(
+    "arguments,expected",
+    [
+        ({}, "Hello, World!"),
+        ({"name": "Alice"}, "Hello, Alice!"),
+    ],
+    ids=["default", "with_name"],
+)
+async def test_hello_handler(arguments, expected):
+    """Test hello handler with default and custom names."""
+    result = await hello_handler(arguments)
     assert len(result) == 1
-    assert "Hello, World!" in result[0].text
-
-
-@pytest.mark.asyncio
-async def test_hello_handler_with_name():
-    """Test hello handler with custom name."""
-    result = await hello_handler({"name": "Alice"})
-    assert len(result) == 1
-    assert "Hello, Alice!" in result[0].text
+    assert expected in result[0].text